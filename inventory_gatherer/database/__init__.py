@@ -1,3 +1,11 @@
 from .csv_manager import CSVDatabaseManager
 
 __all__ = ["CSVDatabaseManager"]
+
+try:
+    from .parquet_manager import ParquetDatabaseManager
+except ImportError:
+    # pyarrow is optional, installed with the 'parquet' extra
+    pass
+else:
+    __all__.append("ParquetDatabaseManager")
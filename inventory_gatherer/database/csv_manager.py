@@ -1,12 +1,28 @@
 """CSV-based database manager for car postings"""
 
 import csv
-import json
+import heapq
+import io
+import mmap
+import operator
+import os
 from pathlib import Path
-from typing import List, Optional
-from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from inventory_gatherer.models import CarPosting
+from inventory_gatherer.models import CarPosting, CarPostingRow
+
+# Marker written over the first byte of a superseded row
+_TOMBSTONE = '#'
+
+# Minimum number of tombstoned rows before the file is compacted
+_COMPACT_THRESHOLD = 64
+
+# Rows followed by at most this many bytes are removed by sliding the
+# rest of the file back over them instead of being tombstoned
+_SLIDE_LIMIT = 64 * 1024
+
+# Position of the id column in CSVDatabaseManager.fieldnames
+_COL_ID = 0
 
 
 class CSVDatabaseManager:
@@ -30,15 +46,73 @@ class CSVDatabaseManager:
             'image_urls', 'thumbnail_url', 'gathered_at', 'features',
             'condition', 'vin'
         ]
+        # Maps posting id -> (byte offset, byte length) of its row, valid
+        # while the file's (mtime, size) matches the key
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._index_key: Optional[Tuple[int, int]] = None
+        self._tombstones = 0
+        # Parsed postings, valid while the file's (mtime, size) matches the key
+        self._cache: Optional[List[CarPostingRow]] = None
+        self._cache_key: Optional[Tuple[int, int]] = None
         self._ensure_file_exists()
 
     def _ensure_file_exists(self):
-        """Create CSV file with headers if it doesn't exist"""
+        """Create CSV file with headers if it doesn't exist, then index it"""
         if not self.csv_path.exists():
             with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.DictWriter(f, fieldnames=self.fieldnames)
                 writer.writeheader()
 
+        self._reindex()
+
+    def _reindex(self):
+        """Rebuild the offset index from the CSV file"""
+        self._index.clear()
+        with open(self.csv_path, 'rb') as f:
+            f.readline()  # Skip header
+            self._tombstones = self._index_rows(f)
+        self._index_key = self._file_key()
+
+    def _sync_index(self):
+        """Rebuild the offset index if the file changed outside this manager"""
+        if self._file_key() != self._index_key:
+            self._reindex()
+
+    def _index_rows(self, f) -> int:
+        """
+        Add rows from the current position of a binary file to the index.
+
+        Returns:
+            Number of tombstoned rows seen
+        """
+        tombstones = 0
+        for offset, length, values in self._scan_rows(f):
+            if values[_COL_ID].startswith(_TOMBSTONE):
+                tombstones += 1
+            else:
+                self._index[values[_COL_ID]] = (offset, length)
+        return tombstones
+
+    def _scan_rows(self, f) -> Iterator[Tuple[int, int, List[str]]]:
+        """
+        Yield (offset, length, values) for each row from the current
+        position of a binary file.
+
+        csv.reader pulls exactly one line at a time, so the file position
+        before and after each record brackets its bytes, even when quoted
+        fields span several lines.
+        """
+        lines = (line.decode('utf-8') for line in iter(f.readline, b''))
+        reader = csv.reader(lines)
+
+        while True:
+            offset = f.tell()
+            values = next(reader, None)
+            if values is None:
+                return
+            if values:
+                yield offset, f.tell() - offset, values
+
     def save_posting(self, posting: CarPosting) -> bool:
         """
         Save or update a car posting.
@@ -49,58 +123,167 @@ class CSVDatabaseManager:
         Returns:
             True if new posting, False if updated existing
         """
-        # Check if posting already exists
-        existing = self.get_posting_by_id(posting.id)
-        is_new = existing is None
+        self._sync_index()
+
+        # Check if posting already exists, possibly under its legacy ID
+        stored_id = self._stored_id(posting)
+        is_new = stored_id is None
 
         if not is_new:
             # Remove the old entry
-            self._remove_posting(posting.id)
+            self._remove_posting(stored_id)
 
         # Append the new/updated posting
-        with open(self.csv_path, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=self.fieldnames)
-            row = self._posting_to_row(posting)
-            writer.writerow(row)
+        self._invalidate_cache()
+        data = self._encode_row(posting.to_row())
+        with open(self.csv_path, 'ab') as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(data)
+        self._index[posting.id] = (offset, len(data))
+        self._index_key = self._file_key()
 
         return is_new
 
-    def get_posting_by_id(self, posting_id: str) -> Optional[CarPosting]:
+    def save_many(self, postings: List[CarPosting]) -> Tuple[int, int]:
         """
-        Retrieve a posting by ID.
+        Save or update many car postings with a single rewrite of the file.
 
         Args:
-            posting_id: Unique identifier
+            postings: CarPosting instances to save
 
         Returns:
-            CarPosting instance or None if not found
+            Tuple of (new posting count, updated posting count)
         """
         with open(self.csv_path, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['id'] == posting_id:
-                    return self._row_to_posting(row)
+            reader = csv.reader(f)
+            next(reader, None)  # Skip header
+            existing = {
+                values[_COL_ID]: values for values in reader
+                if values and not values[_COL_ID].startswith(_TOMBSTONE)
+            }
+
+        new_count = 0
+        updated_count = 0
+        for posting in postings:
+            # Updated postings move to the end, as with save_posting;
+            # rows stored under a legacy ID are re-keyed
+            if (existing.pop(posting.id, None) is None
+                    and existing.pop(CarPosting.legacy_id_for_url(posting.source_url), None) is None):
+                new_count += 1
+            else:
+                updated_count += 1
+            existing[posting.id] = posting.to_row()
+
+        self._invalidate_cache()
+        temp_path = self.csv_path.with_suffix('.tmp')
+        index = {}
+
+        with open(temp_path, 'wb') as f:
+            f.write(self._encode_row(self.fieldnames))
+
+            for posting_id, values in existing.items():
+                data = self._encode_row(values)
+                index[posting_id] = (f.tell(), len(data))
+                f.write(data)
+
+        temp_path.replace(self.csv_path)
+        self._index = index
+        self._index_key = self._file_key()
+        self._tombstones = 0
+
+        return new_count, updated_count
+
+    def _stored_id(self, posting: CarPosting) -> Optional[str]:
+        """Return the ID a posting is stored under, including legacy IDs"""
+        if posting.id in self._index:
+            return posting.id
+        legacy_id = CarPosting.legacy_id_for_url(posting.source_url)
+        if legacy_id in self._index:
+            return legacy_id
         return None
 
-    def get_all_postings(self) -> List[CarPosting]:
+    def get_posting_by_id(self, posting_id: str) -> Optional[CarPostingRow]:
+        """
+        Retrieve a posting by ID.
+
+        Args:
+            posting_id: Unique identifier
+
+        Returns:
+            CarPostingRow instance or None if not found
+        """
+        self._sync_index()
+        values = self._read_row(posting_id)
+        if posting_id in self._index and (values is None or values[_COL_ID] != posting_id):
+            # Offsets went stale without the file key changing
+            self._reindex()
+            values = self._read_row(posting_id)
+
+        return CarPostingRow.from_row(values) if values is not None else None
+
+    def _read_row(self, posting_id: str) -> Optional[List[str]]:
+        """Read the row values stored at a posting's indexed offset"""
+        location = self._index.get(posting_id)
+        if location is None:
+            return None
+
+        offset, length = location
+        with open(self.csv_path, 'rb') as f:
+            f.seek(offset)
+            data = f.read(length).decode('utf-8', errors='replace')
+
+        return next(csv.reader(io.StringIO(data, newline='')), None) or None
+
+    def get_all_postings(self) -> List[CarPostingRow]:
         """
         Get all postings from the database.
 
         Returns:
-            List of CarPosting instances
+            List of CarPostingRow instances
         """
-        postings = []
-        with open(self.csv_path, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    posting = self._row_to_posting(row)
-                    postings.append(posting)
-                except Exception as e:
-                    print(f"Warning: Could not parse row: {e}")
-        return postings
+        key = self._file_key()
+        if self._cache is not None and key == self._cache_key:
+            return list(self._cache)
+
+        postings = list(self._iter_postings())
+        self._cache = postings
+        self._cache_key = key
+        return list(postings)
+
+    def get_columns(self, columns: List[str]) -> Dict[str, List[Any]]:
+        """
+        Get selected fields of all postings, one list per field.
+        Only the requested cells are parsed unless all postings are cached.
+
+        Args:
+            columns: Field names to load
+
+        Returns:
+            Dict mapping each field name to its values, in posting order
 
-    def get_recent_postings(self, limit: int = 10) -> List[CarPosting]:
+        Raises:
+            ValueError: If columns names an unknown field
+        """
+        CarPostingRow.check_columns(columns)
+        result = {name: [] for name in columns}
+
+        if self._cache is not None and self._file_key() == self._cache_key:
+            for posting in self._cache:
+                for name in columns:
+                    result[name].append(getattr(posting, name))
+            return result
+
+        for values in self._iter_values():
+            try:
+                cells = CarPostingRow.parse_cells(values, columns)
+            except Exception as e:
+                print(f"Warning: Could not parse row: {e}")
+                continue
+            for name in columns:
+                result[name].append(cells[name])
+        return result
+
+    def get_recent_postings(self, limit: int = 10) -> List[CarPostingRow]:
         """
         Get most recent postings.
 
@@ -108,12 +291,36 @@ class CSVDatabaseManager:
             limit: Maximum number of postings to return
 
         Returns:
-            List of recent CarPosting instances
+            List of recent CarPostingRow instances
         """
-        all_postings = self.get_all_postings()
-        # Sort by gathered_at descending
-        all_postings.sort(key=lambda p: p.gathered_at, reverse=True)
-        return all_postings[:limit]
+        if self._cache is not None and self._file_key() == self._cache_key:
+            postings = iter(self._cache)
+        else:
+            postings = self._iter_postings()
+        # Keep only the newest `limit` by gathered_at while streaming
+        return heapq.nlargest(limit, postings, key=operator.attrgetter('gathered_at'))
+
+    def _iter_postings(self) -> Iterator[CarPostingRow]:
+        """Yield postings one at a time from the CSV file"""
+        for values in self._iter_values():
+            try:
+                yield CarPostingRow.from_row(values)
+            except Exception as e:
+                print(f"Warning: Could not parse row: {e}")
+
+    def _iter_values(self) -> Iterator[List[str]]:
+        """Yield the cell values of each live row in the CSV file"""
+        with open(self.csv_path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # Skip header
+            for values in reader:
+                if values and not values[_COL_ID].startswith(_TOMBSTONE):
+                    yield values
+
+    def _file_key(self) -> Tuple[int, int]:
+        """Return (mtime, size) of the CSV file for cache and index validation"""
+        stat = self.csv_path.stat()
+        return stat.st_mtime_ns, stat.st_size
 
     def count_postings(self) -> int:
         """
@@ -122,73 +329,103 @@ class CSVDatabaseManager:
         Returns:
             Number of postings in database
         """
-        with open(self.csv_path, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            return sum(1 for _ in reader)
+        # The offset index holds exactly one entry per live row
+        self._sync_index()
+        return len(self._index)
 
     def _remove_posting(self, posting_id: str):
-        """Remove a posting from the CSV file"""
+        """
+        Remove a posting from the CSV file.
+
+        Rows near the end of the file are cut out by moving the trailing
+        bytes back and truncating. Other rows are tombstoned in place
+        rather than rewriting the file; tombstoned rows are dropped once
+        enough of them accumulate.
+        """
+        location = self._index.pop(posting_id, None)
+        if location is None:
+            return
+
+        self._invalidate_cache()
+        offset, length = location
+        end = offset + length
+        prefix = f"{posting_id},".encode()
+
+        with open(self.csv_path, 'r+b') as f:
+            size = f.seek(0, os.SEEK_END)
+            tail = size - end
+            f.seek(offset)
+
+            if tail < 0 or f.read(len(prefix)) != prefix:
+                # The file changed under the index; fall back to a full rewrite
+                stale = True
+            elif tail > _SLIDE_LIMIT:
+                stale = False
+                f.seek(offset)
+                f.write(_TOMBSTONE.encode())
+                self._tombstones += 1
+            else:
+                stale = False
+                if tail:
+                    with mmap.mmap(f.fileno(), 0) as mm:
+                        mm.move(offset, end, tail)
+                f.truncate(size - length)
+
+                # Only rows in the moved tail changed offset; reindex them
+                f.seek(offset)
+                self._index_rows(f)
+
+        if stale:
+            self._rewrite_without(posting_id)
+            return
+
+        self._index_key = self._file_key()
+
+        if self._tombstones > max(_COMPACT_THRESHOLD, len(self._index)):
+            self._compact()
+
+    def _rewrite_without(self, posting_id: str):
+        """Rewrite the CSV file without the given posting and rebuild the index"""
         temp_path = self.csv_path.with_suffix('.tmp')
 
         with open(self.csv_path, 'r', newline='', encoding='utf-8') as f_in:
             with open(temp_path, 'w', newline='', encoding='utf-8') as f_out:
-                reader = csv.DictReader(f_in)
-                writer = csv.DictWriter(f_out, fieldnames=self.fieldnames)
-                writer.writeheader()
+                reader = csv.reader(f_in)
+                writer = csv.writer(f_out)
+                writer.writerow(next(reader, self.fieldnames))
 
-                for row in reader:
-                    if row['id'] != posting_id:
-                        writer.writerow(row)
+                for values in reader:
+                    if values and not values[_COL_ID].startswith(_TOMBSTONE) and values[_COL_ID] != posting_id:
+                        writer.writerow(values)
 
         temp_path.replace(self.csv_path)
+        self._reindex()
 
-    def _posting_to_row(self, posting: CarPosting) -> dict:
-        """Convert CarPosting to CSV row"""
-        data = posting.to_dict()
-
-        # Convert complex types to JSON strings
-        data['image_urls'] = json.dumps(data.get('image_urls', []))
-        data['features'] = json.dumps(data.get('features', {}))
-        data['gathered_at'] = data['gathered_at'].isoformat() if isinstance(data.get('gathered_at'), datetime) else data.get('gathered_at', '')
-
-        # Ensure all fields are present
-        row = {field: data.get(field, '') for field in self.fieldnames}
-        return row
-
-    def _row_to_posting(self, row: dict) -> CarPosting:
-        """Convert CSV row to CarPosting"""
-        # Parse JSON fields
-        if row.get('image_urls'):
-            row['image_urls'] = json.loads(row['image_urls']) if row['image_urls'] else []
-        else:
-            row['image_urls'] = []
-
-        if row.get('features'):
-            row['features'] = json.loads(row['features']) if row['features'] else {}
-        else:
-            row['features'] = {}
-
-        # Parse datetime
-        if row.get('gathered_at'):
-            row['gathered_at'] = datetime.fromisoformat(row['gathered_at'])
-
-        # Convert numeric fields
-        for field in ['year', 'mileage']:
-            if row.get(field):
-                try:
-                    row[field] = int(row[field])
-                except (ValueError, TypeError):
-                    row[field] = None
-
-        if row.get('price'):
-            try:
-                row['price'] = float(row['price'])
-            except (ValueError, TypeError):
-                row['price'] = None
+    def _compact(self):
+        """Rewrite the CSV file without tombstoned rows"""
+        temp_path = self.csv_path.with_suffix('.tmp')
+        index = {}
 
-        # Remove empty strings, replace with None
-        for key, value in row.items():
-            if value == '':
-                row[key] = None
+        with open(self.csv_path, 'rb') as f_in, open(temp_path, 'wb') as f_out:
+            f_out.write(f_in.readline())  # Header
+            for posting_id, (offset, length) in sorted(self._index.items(), key=lambda item: item[1][0]):
+                f_in.seek(offset)
+                index[posting_id] = (f_out.tell(), length)
+                f_out.write(f_in.read(length))
 
-        return CarPosting(**row)
+        temp_path.replace(self.csv_path)
+        self._index = index
+        self._index_key = self._file_key()
+        self._tombstones = 0
+
+    def _invalidate_cache(self):
+        """Drop parsed postings after the file is modified"""
+        self._cache = None
+        self._cache_key = None
+
+    def _encode_row(self, values: List[str]) -> bytes:
+        """Serialize CSV row values to bytes"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(values)
+        return buffer.getvalue().encode('utf-8')
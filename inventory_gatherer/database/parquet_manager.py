@@ -0,0 +1,198 @@
+"""Parquet-based database manager for car postings"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from inventory_gatherer.models import CarPosting, CarPostingRow
+
+_SCHEMA = pa.schema([
+    ('id', pa.string()),
+    ('source_url', pa.string()),
+    ('source_platform', pa.string()),
+    ('title', pa.string()),
+    ('make', pa.string()),
+    ('model', pa.string()),
+    ('year', pa.int32()),
+    ('mileage', pa.int64()),
+    ('price', pa.float64()),
+    ('currency', pa.string()),
+    ('description', pa.string()),
+    ('location', pa.string()),
+    ('image_urls', pa.list_(pa.string())),
+    ('thumbnail_url', pa.string()),
+    ('gathered_at', pa.timestamp('us')),
+    ('features', pa.string()),
+    ('condition', pa.string()),
+    ('vin', pa.string()),
+])
+
+
+class ParquetDatabaseManager:
+    """
+    Columnar Parquet-based database for car postings.
+    Drop-in alternative to CSVDatabaseManager with the same public API.
+    Numeric and timestamp columns are stored typed, so aggregates and
+    sorts read compressed columns instead of reparsing text rows.
+    """
+
+    def __init__(self, parquet_path: str = "car_postings.parquet"):
+        """
+        Initialize Parquet database manager.
+
+        Args:
+            parquet_path: Path to the Parquet file
+        """
+        self.parquet_path = Path(parquet_path)
+        self._ensure_file_exists()
+
+    def _ensure_file_exists(self):
+        """Create an empty Parquet file if it doesn't exist"""
+        if not self.parquet_path.exists():
+            self._write_table(_SCHEMA.empty_table())
+
+    def save_posting(self, posting: CarPosting) -> bool:
+        """
+        Save or update a car posting.
+
+        Args:
+            posting: CarPosting instance to save
+
+        Returns:
+            True if new posting, False if updated existing
+        """
+        new_count, _ = self.save_many([posting])
+        return new_count == 1
+
+    def save_many(self, postings: List[CarPosting]) -> Tuple[int, int]:
+        """
+        Save or update many car postings with a single rewrite of the file.
+
+        Args:
+            postings: CarPosting instances to save
+
+        Returns:
+            Tuple of (new posting count, updated posting count)
+        """
+        existing = pq.read_table(self.parquet_path)
+        existing_ids = set(existing.column('id').to_pylist())
+
+        latest = {}
+        replaced_ids = set()
+        new_count = 0
+        updated_count = 0
+        for posting in postings:
+            # Rows stored under a legacy ID are re-keyed
+            legacy_id = CarPosting.legacy_id_for_url(posting.source_url)
+            if legacy_id in existing_ids:
+                replaced_ids.add(legacy_id)
+
+            if posting.id in existing_ids or posting.id in latest or legacy_id in existing_ids:
+                updated_count += 1
+            else:
+                new_count += 1
+            # Updated postings move to the end, as with the CSV backend
+            latest.pop(posting.id, None)
+            latest[posting.id] = posting
+
+        replaced_ids.update(latest)
+        kept = existing.filter(pc.invert(pc.is_in(existing['id'], value_set=pa.array(list(replaced_ids), pa.string()))))
+        # Build columns directly rather than going through per-row dicts
+        table = pa.table(CarPosting.to_columns(list(latest.values())), schema=_SCHEMA)
+        self._write_table(pa.concat_tables([kept, table]))
+
+        return new_count, updated_count
+
+    def get_posting_by_id(self, posting_id: str) -> Optional[CarPostingRow]:
+        """
+        Retrieve a posting by ID.
+
+        Args:
+            posting_id: Unique identifier
+
+        Returns:
+            CarPostingRow instance or None if not found
+        """
+        table = pq.read_table(self.parquet_path, filters=[('id', '==', posting_id)])
+        if table.num_rows == 0:
+            return None
+        return self._record_to_posting(table.slice(0, 1).to_pylist()[0])
+
+    def get_all_postings(self) -> List[CarPostingRow]:
+        """
+        Get all postings from the database.
+
+        Returns:
+            List of CarPostingRow instances
+        """
+        postings = []
+        for record in pq.read_table(self.parquet_path).to_pylist():
+            try:
+                postings.append(self._record_to_posting(record))
+            except Exception as e:
+                print(f"Warning: Could not parse row: {e}")
+        return postings
+
+    def get_columns(self, columns: List[str]) -> Dict[str, List[Any]]:
+        """
+        Get selected fields of all postings, one list per field.
+        Only the requested columns are read from the file.
+
+        Args:
+            columns: Field names to load
+
+        Returns:
+            Dict mapping each field name to its values, in posting order
+
+        Raises:
+            ValueError: If columns names an unknown field
+        """
+        CarPostingRow.check_columns(columns)
+        result = {name: [] for name in columns}
+
+        for record in pq.read_table(self.parquet_path, columns=columns).to_pylist():
+            try:
+                cells = CarPostingRow.parse_record(record)
+            except Exception as e:
+                print(f"Warning: Could not parse row: {e}")
+                continue
+            for name in columns:
+                result[name].append(cells[name])
+        return result
+
+    def get_recent_postings(self, limit: int = 10) -> List[CarPostingRow]:
+        """
+        Get most recent postings.
+
+        Args:
+            limit: Maximum number of postings to return
+
+        Returns:
+            List of recent CarPostingRow instances
+        """
+        table = pq.read_table(self.parquet_path)
+        recent = table.sort_by([('gathered_at', 'descending')]).slice(0, limit)
+        return [self._record_to_posting(record) for record in recent.to_pylist()]
+
+    def count_postings(self) -> int:
+        """
+        Count total number of postings.
+
+        Returns:
+            Number of postings in database
+        """
+        # Row count lives in the file footer, no column data is read
+        return pq.ParquetFile(self.parquet_path).metadata.num_rows
+
+    def _write_table(self, table: pa.Table):
+        """Atomically replace the Parquet file with the given table"""
+        temp_path = self.parquet_path.with_suffix('.tmp')
+        pq.write_table(table, temp_path, compression='zstd')
+        temp_path.replace(self.parquet_path)
+
+    def _record_to_posting(self, record: dict) -> CarPostingRow:
+        """Convert Parquet record to CarPostingRow"""
+        return CarPostingRow.from_record(record)
@@ -1,18 +1,46 @@
 """Data gatherer for RM inventory"""
 
 import re
-import hashlib
+import asyncio
 from typing import List, Optional
 from datetime import datetime
-from playwright.sync_api import sync_playwright, Page, Browser
+from playwright.async_api import async_playwright, Page, Browser
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 from inventory_gatherer.models import CarPosting
 
+# Patterns used on every listing, compiled once
+_PRICE_STRIP = str.maketrans('', '', ',$')
+_NUM_RE = re.compile(r'\d+(?:\.\d+)?')
+_INT_RE = re.compile(r'\d+')
+_YEAR_RE = re.compile(r'\b(?:19\d{2}|20\d{2})\b')
+
+# Candidate selectors for each text field, tried in order
+_FIELD_SELECTORS = {
+    'title': [
+        'h2', 'h3', 'h4',
+        '.title', '.vehicle-title', '.car-title',
+        '[data-title]'
+    ],
+    'price': [
+        '.price', '.vehicle-price', '[data-price]',
+        'span.price', 'div.price'
+    ],
+    'mileage': [
+        '.mileage', '.miles', '[data-mileage]',
+        'span.mileage', 'div.mileage'
+    ],
+    'description': [
+        '.description', '.details', '[data-description]'
+    ],
+}
+
 
 class RMGatherer:
     """
     Data gatherer for RM (responsemotors.com) inventory page.
-    Uses Playwright for dynamic page rendering.
+    Uses Playwright for dynamic page rendering and selectolax
+    to parse the rendered HTML.
     """
 
     def __init__(self, headless: bool = True, timeout: int = 30000):
@@ -33,48 +61,62 @@ class RMGatherer:
         """
         Gather all car listings from RM inventory.
 
+        Returns:
+            List of CarPosting instances
+        """
+        return asyncio.run(self.gather_data_async())
+
+    async def gather_data_async(self) -> List[CarPosting]:
+        """
+        Gather all car listings from RM inventory inside a running event loop.
+
         Returns:
             List of CarPosting instances
         """
         postings = []
 
-        with sync_playwright() as playwright:
+        async with async_playwright() as playwright:
             # Launch browser
-            self.browser = playwright.chromium.launch(headless=self.headless)
-            self.page = self.browser.new_page()
+            self.browser = await playwright.chromium.launch(headless=self.headless)
+            self.page = await self.browser.new_page()
             self.page.set_default_timeout(self.timeout)
 
             try:
                 print(f"Navigating to {self.base_url}...")
-                self.page.goto(self.base_url)
+                await self.page.goto(self.base_url)
 
                 # Wait for page to load - adjust selector based on actual page
                 print("Waiting for inventory to load...")
-                self.page.wait_for_load_state('networkidle')
+                await self.page.wait_for_load_state('networkidle')
 
                 # Extract listings
-                postings = self._extract_listings()
+                postings = await self._extract_listings()
 
                 print(f"Successfully gathered {len(postings)} listings")
 
             except Exception as e:
                 print(f"Error during data gathering: {e}")
                 # Take screenshot for debugging
-                self._take_screenshot("error_screenshot.png")
+                await self._take_screenshot("error_screenshot.png")
 
             finally:
                 # Clean up
                 if self.page:
-                    self.page.close()
+                    await self.page.close()
                 if self.browser:
-                    self.browser.close()
+                    await self.browser.close()
 
         return postings
 
-    def _extract_listings(self) -> List[CarPosting]:
+    async def _extract_listings(self) -> List[CarPosting]:
         """Extract all car listings from the current page"""
         postings = []
 
+        # The page is static once rendered, so fetch its HTML once and
+        # match selectors in-process instead of over the browser connection
+        content = await self.page.content()
+        tree = LexborHTMLParser(content)
+
         # Try multiple common selectors for car listing containers
         # We'll need to adjust these based on the actual HTML structure
         possible_selectors = [
@@ -90,7 +132,7 @@ class RMGatherer:
         used_selector = None
 
         for selector in possible_selectors:
-            elements = self.page.query_selector_all(selector)
+            elements = tree.css(selector)
             if elements and len(elements) > 0:
                 listing_elements = elements
                 used_selector = selector
@@ -100,10 +142,8 @@ class RMGatherer:
         if not listing_elements:
             # Fallback: try to find any reasonable container
             print("Warning: Could not find listings with common selectors.")
-            print("Page title:", self.page.title())
+            print("Page title:", await self.page.title())
 
-            # Get page content for debugging
-            content = self.page.content()
             print(f"Page content length: {len(content)} characters")
 
             # Try to save HTML for manual inspection
@@ -124,40 +164,28 @@ class RMGatherer:
 
         return postings
 
-    def _extract_posting_from_element(self, element, idx: int, parent_selector: str) -> Optional[CarPosting]:
+    def _extract_posting_from_element(self, element: LexborNode, idx: int, parent_selector: str) -> Optional[CarPosting]:
         """Extract car posting data from a single element"""
 
         # Try to extract URL first
-        url_element = element.query_selector('a[href]')
+        url_element = element.css_first('a[href]')
         if url_element:
-            url = url_element.get_attribute('href')
+            url = url_element.attributes.get('href')
             if url and not url.startswith('http'):
                 url = f"https://responsemotors.com{url}"
         else:
             url = f"{self.base_url}#listing-{idx}"
 
         # Generate unique ID from URL
-        posting_id = hashlib.md5(url.encode()).hexdigest()[:16]
-
-        # Extract title - try multiple selectors
-        title = self._safe_extract_text(element, [
-            'h2', 'h3', 'h4',
-            '.title', '.vehicle-title', '.car-title',
-            '[data-title]'
-        ]) or f"Vehicle {idx + 1}"
-
-        # Extract price
-        price_text = self._safe_extract_text(element, [
-            '.price', '.vehicle-price', '[data-price]',
-            'span.price', 'div.price'
-        ])
+        posting_id = CarPosting.id_for_url(url)
+
+        # Extract text fields
+        title = self._safe_extract_text(element, _FIELD_SELECTORS['title']) or f"Vehicle {idx + 1}"
+
+        price_text = self._safe_extract_text(element, _FIELD_SELECTORS['price'])
         price = self._parse_price(price_text) if price_text else None
 
-        # Extract mileage
-        mileage_text = self._safe_extract_text(element, [
-            '.mileage', '.miles', '[data-mileage]',
-            'span.mileage', 'div.mileage'
-        ])
+        mileage_text = self._safe_extract_text(element, _FIELD_SELECTORS['mileage'])
         mileage = self._parse_mileage(mileage_text) if mileage_text else None
 
         # Extract year
@@ -167,17 +195,14 @@ class RMGatherer:
         make, model = self._extract_make_model(title)
 
         # Extract image
-        img_element = element.query_selector('img')
+        img_element = element.css_first('img')
         thumbnail_url = None
         if img_element:
-            thumbnail_url = img_element.get_attribute('src')
+            thumbnail_url = img_element.attributes.get('src')
             if thumbnail_url and not thumbnail_url.startswith('http'):
                 thumbnail_url = f"https://responsemotors.com{thumbnail_url}"
 
-        # Extract description/details
-        description = self._safe_extract_text(element, [
-            '.description', '.details', '[data-description]'
-        ])
+        description = self._safe_extract_text(element, _FIELD_SELECTORS['description'])
 
         # Create CarPosting instance
         posting = CarPosting(
@@ -199,17 +224,15 @@ class RMGatherer:
 
         return posting
 
-    def _safe_extract_text(self, element, selectors: List[str]) -> Optional[str]:
+    def _safe_extract_text(self, element: LexborNode, selectors: List[str]) -> Optional[str]:
         """Try multiple selectors to extract text"""
         for selector in selectors:
-            try:
-                el = element.query_selector(selector)
-                if el:
-                    text = el.inner_text().strip()
-                    if text:
-                        return text
-            except Exception:
-                continue
+            el = element.css_first(selector)
+            if el:
+                # Join text nodes as innerText does, then collapse whitespace runs
+                text = ' '.join(el.text().split())
+                if text:
+                    return text
         return None
 
     def _parse_price(self, price_text: str) -> Optional[float]:
@@ -218,10 +241,10 @@ class RMGatherer:
             return None
 
         # Remove currency symbols and commas
-        cleaned = re.sub(r'[,$]', '', price_text)
+        cleaned = price_text.translate(_PRICE_STRIP)
 
         # Extract first number
-        match = re.search(r'\d+(?:\.\d+)?', cleaned)
+        match = _NUM_RE.search(cleaned)
         if match:
             try:
                 return float(match.group())
@@ -235,11 +258,11 @@ class RMGatherer:
         if not mileage_text:
             return None
 
-        # Remove commas and non-digits
-        cleaned = re.sub(r'[,]', '', mileage_text)
+        # Remove commas
+        cleaned = mileage_text.replace(',', '')
 
         # Extract first number
-        match = re.search(r'\d+', cleaned)
+        match = _INT_RE.search(cleaned)
         if match:
             try:
                 return int(match.group())
@@ -254,7 +277,7 @@ class RMGatherer:
             return None
 
         # Look for 4-digit year (1900-2099)
-        match = re.search(r'\b(19\d{2}|20\d{2})\b', title)
+        match = _YEAR_RE.search(title)
         if match:
             return int(match.group())
 
@@ -269,7 +292,7 @@ class RMGatherer:
             return None, None
 
         # Remove year from title
-        title_no_year = re.sub(r'\b(19\d{2}|20\d{2})\b', '', title).strip()
+        title_no_year = _YEAR_RE.sub('', title).strip()
 
         # Split into words
         words = title_no_year.split()
@@ -283,11 +306,11 @@ class RMGatherer:
 
         return None, None
 
-    def _take_screenshot(self, filename: str = "screenshot.png"):
+    async def _take_screenshot(self, filename: str = "screenshot.png"):
         """Take a screenshot for debugging"""
         if self.page:
             try:
-                self.page.screenshot(path=filename)
+                await self.page.screenshot(path=filename)
                 print(f"Screenshot saved to {filename}")
             except Exception as e:
                 print(f"Could not take screenshot: {e}")
@@ -1,3 +1,3 @@
-from .car_posting import CarPosting
+from .car_posting import CarPosting, CarPostingRow
 
-__all__ = ["CarPosting"]
+__all__ = ["CarPosting", "CarPostingRow"]
@@ -1,7 +1,10 @@
 """Car posting data model"""
 
+import hashlib
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Mapping, Tuple
+import orjson
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -66,6 +69,16 @@ class CarPosting(BaseModel):
             raise ValueError("Mileage cannot be negative")
         return v
 
+    @staticmethod
+    def id_for_url(url: str) -> str:
+        """Derive the unique posting ID from its source URL"""
+        return hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+
+    @staticmethod
+    def legacy_id_for_url(url: str) -> str:
+        """ID the same URL had before BLAKE2b IDs, used to re-key stored rows"""
+        return hashlib.md5(url.encode()).hexdigest()[:16]
+
     def to_dict(self) -> dict:
         """Convert to dictionary for storage"""
         return self.model_dump(mode='json')
@@ -75,9 +88,213 @@ class CarPosting(BaseModel):
         """Create instance from dictionary"""
         return cls(**data)
 
+    def to_row(self) -> List[Any]:
+        """Convert to flat CSV row values, in CarPostingRow field order"""
+        data = self.to_dict()
+        data['image_urls'] = orjson.dumps(data['image_urls']).decode()
+        data['features'] = orjson.dumps(data['features']).decode()
+        return [data[name] for name in ROW_FIELDS]
+
+    @classmethod
+    def to_columns(cls, postings: List['CarPosting']) -> Dict[str, List[Any]]:
+        """
+        Convert postings to one list per field, in CarPostingRow field order.
+        Features are JSON-encoded since their values are free-form.
+        """
+        columns = {name: [getattr(posting, name) for posting in postings] for name in ROW_FIELDS}
+        columns['features'] = [orjson.dumps(features).decode() for features in columns['features']]
+        return columns
+
     def __str__(self) -> str:
         """String representation"""
-        return (
-            f"{self.year or '????'} {self.make or 'Unknown'} {self.model or 'Unknown'} - "
-            f"${self.price:,.0f if self.price else 0} - {self.mileage or '???'} miles"
+        return _summarize(self)
+
+
+@dataclass(slots=True, frozen=True)
+class CarPostingRow:
+    """
+    Lightweight read-only car posting loaded from storage.
+    Has the same fields as CarPosting but skips Pydantic validation,
+    since stored data was already validated when it was gathered.
+    image_urls and features are stored as a tuple and a read-only
+    dict so shared instances cannot be modified.
+    """
+
+    id: str
+    source_url: str
+    source_platform: str
+    title: str
+    make: Optional[str]
+    model: Optional[str]
+    year: Optional[int]
+    mileage: Optional[int]
+    price: Optional[float]
+    currency: str
+    description: Optional[str]
+    location: Optional[str]
+    image_urls: Tuple[str, ...]
+    thumbnail_url: Optional[str]
+    gathered_at: datetime
+    features: Mapping[str, Any]
+    condition: Optional[str]
+    vin: Optional[str]
+
+    @staticmethod
+    def check_columns(columns: List[str]):
+        """Raise ValueError if any column is not a CarPostingRow field"""
+        unknown = [name for name in columns if name not in _ROW_POSITIONS]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+
+    @staticmethod
+    def parse_cells(values: List[str], columns: List[str]) -> Dict[str, Any]:
+        """
+        Parse only the given fields of a CSV row.
+
+        Args:
+            values: Cell values in ROW_FIELDS order
+            columns: Field names to parse
+
+        Returns:
+            Dict of field name to parsed value
+        """
+        return {
+            name: _CELL_PARSERS.get(name, _parse_str)(values[_ROW_POSITIONS[name]])
+            for name in columns
+        }
+
+    @staticmethod
+    def parse_record(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Freeze the containers of a typed storage record, possibly a field subset"""
+        if 'features' in record:
+            record['features'] = _parse_features(record['features'])
+        if 'image_urls' in record:
+            record['image_urls'] = tuple(record['image_urls'] or ())
+        return record
+
+    @classmethod
+    def from_row(cls, values: List[str]) -> 'CarPostingRow':
+        """Create instance from CSV row values in ROW_FIELDS order"""
+        (
+            id, source_url, source_platform, title, make, model, year,
+            mileage, price, currency, description, location, image_urls,
+            thumbnail_url, gathered_at, features, condition, vin,
+        ) = values
+        return cls(
+            id,
+            source_url,
+            source_platform,
+            title,
+            make or None,
+            model or None,
+            _parse_int(year),
+            _parse_int(mileage),
+            _parse_float(price),
+            currency,
+            description or None,
+            location or None,
+            _parse_image_urls(image_urls),
+            thumbnail_url or None,
+            datetime.fromisoformat(gathered_at),
+            _parse_features(features),
+            condition or None,
+            vin or None,
         )
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> 'CarPostingRow':
+        """Create instance from a typed storage record"""
+        return cls(**cls.parse_record(record))
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-compatible dictionary, as CarPosting.to_dict does"""
+        return orjson.loads(orjson.dumps(self))
+
+    def __str__(self) -> str:
+        """String representation"""
+        return _summarize(self)
+
+
+class _FrozenDict(dict):
+    """
+    Read-only dict for row features.
+    Stays a dict subclass so rows still pickle and serialize as JSON,
+    and is hashable so frozen rows are too.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+def _summarize(posting: Any) -> str:
+    """One-line summary shared by CarPosting and CarPostingRow"""
+    price_str = f"${posting.price:,.0f}" if posting.price else "$0"
+    return (
+        f"{posting.year or '????'} {posting.make or 'Unknown'} {posting.model or 'Unknown'} - "
+        f"{price_str} - {posting.mileage or '???'} miles"
+    )
+
+
+def _parse_int(value: str) -> Optional[int]:
+    """Parse an integer cell, None if empty or invalid"""
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+def _parse_float(value: str) -> Optional[float]:
+    """Parse a float cell, None if empty or invalid"""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def _parse_str(value: str) -> Optional[str]:
+    """Parse a text cell, None if empty"""
+    return value or None
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert lists to tuples and dicts to read-only dicts"""
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _parse_image_urls(value: str) -> Tuple[str, ...]:
+    """Parse a JSON image URL list cell into a tuple"""
+    return tuple(orjson.loads(value)) if value else ()
+
+
+def _parse_features(value: str) -> Mapping[str, Any]:
+    """Parse a JSON features cell into a read-only dict"""
+    return _freeze(orjson.loads(value)) if value else _EMPTY_FEATURES
+
+
+# Storage column order shared by CarPosting.to_row and CarPostingRow.from_row
+ROW_FIELDS = [field.name for field in fields(CarPostingRow)]
+_ROW_POSITIONS = {name: position for position, name in enumerate(ROW_FIELDS)}
+_EMPTY_FEATURES = _FrozenDict()
+
+# Cell parsers for parse_cells; fields not listed are plain text
+_CELL_PARSERS = {
+    'year': _parse_int,
+    'mileage': _parse_int,
+    'price': _parse_float,
+    'image_urls': _parse_image_urls,
+    'gathered_at': datetime.fromisoformat,
+    'features': _parse_features,
+}
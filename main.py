@@ -9,6 +9,8 @@ Gathers listings and stores them in CSV format.
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -21,24 +23,28 @@ def print_separator(char="=", length=80):
     print(char * length)
 
 
-def print_posting(posting, index: int):
-    """Pretty print a car posting"""
-    print(f"\n{index}. {posting.title}")
-    print(f"   URL: {posting.source_url}")
+def format_posting(posting, index: int) -> str:
+    """Format a car posting for display"""
+    lines = [
+        f"\n{index}. {posting.title}",
+        f"   URL: {posting.source_url}",
+    ]
 
     if posting.year:
-        print(f"   Year: {posting.year}")
+        lines.append(f"   Year: {posting.year}")
     if posting.make:
-        print(f"   Make: {posting.make}")
+        lines.append(f"   Make: {posting.make}")
     if posting.model:
-        print(f"   Model: {posting.model}")
+        lines.append(f"   Model: {posting.model}")
     if posting.price:
-        print(f"   Price: ${posting.price:,.2f}")
+        lines.append(f"   Price: ${posting.price:,.2f}")
     if posting.mileage:
-        print(f"   Mileage: {posting.mileage:,} miles")
+        lines.append(f"   Mileage: {posting.mileage:,} miles")
     if posting.description:
         desc = posting.description[:100] + "..." if len(posting.description) > 100 else posting.description
-        print(f"   Description: {desc}")
+        lines.append(f"   Description: {desc}")
+
+    return "\n".join(lines)
 
 
 def main():
@@ -80,15 +86,7 @@ def main():
 
         # Save to database
         print("\nSaving to database...")
-        new_count = 0
-        updated_count = 0
-
-        for posting in postings:
-            is_new = db.save_posting(posting)
-            if is_new:
-                new_count += 1
-            else:
-                updated_count += 1
+        new_count, updated_count = db.save_many(postings)
 
         print(f"New postings: {new_count}")
         print(f"Updated postings: {updated_count}")
@@ -98,8 +96,9 @@ def main():
         print("GATHERED LISTINGS:")
         print_separator()
 
-        for idx, posting in enumerate(postings, 1):
-            print_posting(posting, idx)
+        # Write the whole block at once rather than one line at a time
+        parts = [format_posting(posting, idx) for idx, posting in enumerate(postings, 1)]
+        sys.stdout.write("\n".join(parts) + "\n")
 
         print_separator()
         print(f"\nTotal postings in database: {db.count_postings()}")
@@ -110,19 +109,19 @@ def main():
         print("\nSUMMARY STATISTICS:")
         print_separator()
 
-        prices = [p.price for p in postings if p.price]
-        if prices:
-            print(f"Average Price: ${sum(prices) / len(prices):,.2f}")
-            print(f"Min Price: ${min(prices):,.2f}")
-            print(f"Max Price: ${max(prices):,.2f}")
+        prices = np.fromiter((p.price for p in postings if p.price), dtype=np.float64)
+        if prices.size:
+            print(f"Average Price: ${prices.mean():,.2f}")
+            print(f"Min Price: ${prices.min():,.2f}")
+            print(f"Max Price: ${prices.max():,.2f}")
 
-        mileages = [p.mileage for p in postings if p.mileage]
-        if mileages:
-            print(f"Average Mileage: {sum(mileages) // len(mileages):,} miles")
+        mileages = np.fromiter((p.mileage for p in postings if p.mileage), dtype=np.int64)
+        if mileages.size:
+            print(f"Average Mileage: {mileages.sum() // mileages.size:,} miles")
 
-        years = [p.year for p in postings if p.year]
-        if years:
-            print(f"Year Range: {min(years)} - {max(years)}")
+        years = np.fromiter((p.year for p in postings if p.year), dtype=np.int16)
+        if years.size:
+            print(f"Year Range: {years.min()} - {years.max()}")
 
         print_separator()
 
@@ -0,0 +1,49 @@
+"""Tests for the car posting models"""
+
+import dataclasses
+import json
+import pickle
+
+import pytest
+
+from inventory_gatherer.models import CarPosting, CarPostingRow
+
+
+def make_row():
+    posting = CarPosting(
+        id="abc",
+        source_url="https://responsemotors.com/inventory/x/1",
+        title="2020 Honda Civic",
+        make="Honda",
+        model="Civic",
+        year=2020,
+        mileage=12000,
+        price=25999,
+        image_urls=["https://example.com/1.jpg"],
+        features={"Drivetrain": "FWD", "Options": ["Sunroof", {"Trim": "EX"}]},
+    )
+    return posting, CarPostingRow.from_row(posting.to_row())
+
+
+def test_row_matches_posting():
+    posting, row = make_row()
+    assert str(row) == str(posting) == "2020 Honda Civic - $25,999 - 12000 miles"
+    assert row.to_dict() == posting.to_dict()
+
+
+def test_row_containers_are_read_only():
+    _, row = make_row()
+    with pytest.raises(TypeError):
+        row.features["Drivetrain"] = "AWD"
+    with pytest.raises(TypeError):
+        row.features["Options"][1].update(Trim="LX")
+    with pytest.raises(AttributeError):
+        row.image_urls.append("https://example.com/2.jpg")
+
+
+def test_row_pickles_serializes_and_hashes():
+    _, row = make_row()
+    assert pickle.loads(pickle.dumps(row)) == row
+    assert dataclasses.asdict(row)["features"]["Drivetrain"] == "FWD"
+    assert json.loads(json.dumps(row.features))["Options"] == ["Sunroof", {"Trim": "EX"}]
+    assert hash(row) == hash(pickle.loads(pickle.dumps(row)))
@@ -0,0 +1,105 @@
+"""Tests for the CSV database manager"""
+
+import pytest
+
+from inventory_gatherer.database import CSVDatabaseManager, csv_manager
+from inventory_gatherer.models import CarPosting
+
+
+def make_posting(n: int, price: float = 1000.0) -> CarPosting:
+    url = f"https://responsemotors.com/inventory/x/{n}"
+    return CarPosting(
+        id=CarPosting.id_for_url(url),
+        source_url=url,
+        title=f"2020 Honda Civic {n}",
+        price=price,
+        description="Line one\nline two, with \"quotes\"",
+    )
+
+
+def assert_consistent(db: CSVDatabaseManager):
+    """The index matches a fresh scan and every offset holds its own row"""
+    fresh = CSVDatabaseManager(db.csv_path)
+    assert fresh._index == db._index
+    assert fresh._tombstones == db._tombstones
+    for posting_id in db._index:
+        assert db.get_posting_by_id(posting_id).id == posting_id
+    assert sorted(p.id for p in fresh.get_all_postings()) == sorted(db._index)
+
+
+def test_second_manager_sees_rewrite(tmp_path):
+    path = tmp_path / "postings.csv"
+    a = CSVDatabaseManager(path)
+    a.save_many([make_posting(n) for n in range(10)])
+    b = CSVDatabaseManager(path)
+
+    # Moves x/0 to the end, shifting every other row's offset
+    a.save_many([make_posting(0, price=1.0)])
+
+    assert b.get_posting_by_id(make_posting(0).id).price == 1.0
+    assert b.save_posting(make_posting(4, price=4.0)) is False
+
+    rows = CSVDatabaseManager(path).get_all_postings()
+    assert sorted(p.source_url for p in rows) == sorted(make_posting(n).source_url for n in range(10))
+    assert {p.id: p.price for p in rows}[make_posting(4).id] == 4.0
+    assert_consistent(b)
+
+
+def test_index_survives_tombstone_slide_and_compaction(tmp_path, monkeypatch):
+    # Rows are ~170 bytes, so only a row next to the end slides
+    monkeypatch.setattr(csv_manager, '_SLIDE_LIMIT', 256)
+    monkeypatch.setattr(csv_manager, '_COMPACT_THRESHOLD', 2)
+    db = CSVDatabaseManager(tmp_path / "postings.csv")
+    db.save_many([make_posting(n) for n in range(3)])
+
+    # Far from the end: tombstoned in place
+    db.save_posting(make_posting(0, price=2.0))
+    assert db._tombstones == 1
+    assert_consistent(db)
+
+    # Second to last: the tail slides back over the row
+    db.save_posting(make_posting(2, price=3.0))
+    assert db._tombstones == 1
+    assert_consistent(db)
+
+    # Enough tombstones trigger a compaction
+    compacted = False
+    for n, price in ((1, 4.0), (0, 5.0), (2, 6.0)):
+        tombstones = db._tombstones
+        db.save_posting(make_posting(n, price=price))
+        compacted = compacted or db._tombstones < tombstones
+        assert_consistent(db)
+    assert compacted
+
+    prices = {p.id: p.price for p in CSVDatabaseManager(db.csv_path).get_all_postings()}
+    assert prices == {make_posting(0).id: 5.0, make_posting(1).id: 4.0, make_posting(2).id: 6.0}
+
+
+def test_remove_falls_back_when_offset_is_stale(tmp_path):
+    db = CSVDatabaseManager(tmp_path / "postings.csv")
+    db.save_many([make_posting(n) for n in range(5)])
+
+    # Point x/3 at x/1's row without the file changing
+    db._index[make_posting(3).id] = db._index[make_posting(1).id]
+    db._remove_posting(make_posting(3).id)
+
+    remaining = {p.id for p in CSVDatabaseManager(db.csv_path).get_all_postings()}
+    assert remaining == {make_posting(n).id for n in (0, 1, 2, 4)}
+    assert_consistent(db)
+
+
+def test_get_columns(tmp_path):
+    db = CSVDatabaseManager(tmp_path / "postings.csv")
+    db.save_many([make_posting(n, price=float(n)) for n in range(3)])
+
+    expected = {
+        'price': [0.0, 1.0, 2.0],
+        'features': [{}, {}, {}],
+    }
+    # Parsed from the file, then served from the cache
+    assert db.get_columns(['price', 'features']) == expected
+    db.get_all_postings()
+    assert db.get_columns(['price', 'features']) == expected
+
+    with pytest.raises(ValueError):
+        db.get_columns(['price', 'prize'])
@@ -0,0 +1,33 @@
+"""Tests for the Parquet database manager"""
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from inventory_gatherer.database import ParquetDatabaseManager  # noqa: E402
+from inventory_gatherer.models import CarPosting  # noqa: E402
+
+
+def make_posting(n: int, price: float = 1000.0) -> CarPosting:
+    url = f"https://responsemotors.com/inventory/x/{n}"
+    return CarPosting(
+        id=CarPosting.id_for_url(url),
+        source_url=url,
+        title=f"2020 Honda Civic {n}",
+        price=price,
+        image_urls=[f"https://example.com/{n}.jpg"],
+        features={"Drivetrain": "FWD"},
+    )
+
+
+def test_get_columns(tmp_path):
+    db = ParquetDatabaseManager(tmp_path / "postings.parquet")
+    db.save_many([make_posting(n, price=float(n)) for n in range(3)])
+
+    columns = db.get_columns(['price', 'image_urls', 'features'])
+    assert columns['price'] == [0.0, 1.0, 2.0]
+    assert columns['image_urls'][1] == ("https://example.com/1.jpg",)
+    assert columns['features'] == [{"Drivetrain": "FWD"}] * 3
+
+    with pytest.raises(ValueError):
+        db.get_columns(['price', 'prize'])
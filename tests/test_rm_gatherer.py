@@ -0,0 +1,18 @@
+"""Tests for the Response Motors gatherer's HTML extraction"""
+
+from selectolax.lexbor import LexborHTMLParser
+
+from inventory_gatherer.gatherers import RMGatherer
+
+
+def test_extracted_text_matches_inner_text():
+    gatherer = RMGatherer()
+    body = LexborHTMLParser(
+        '<div><span class="price">$25,<small>999</small></span>'
+        '<h3>\n    2020   Honda\n    Civic\n  </h3></div>'
+    ).body
+
+    price_text = gatherer._safe_extract_text(body, ['.price'])
+    assert price_text == '$25,999'
+    assert gatherer._parse_price(price_text) == 25999.0
+    assert gatherer._safe_extract_text(body, ['h3']) == '2020 Honda Civic'